@@ -1,8 +1,14 @@
+import sys
 from datetime import datetime, timedelta
 from timeslots.timely import EventSlot, BusinessHours, TimeSlot, Calendar
 
 format = "%d/%m/%Y %H:%M"
 
+def write_lines(lines: str):
+    # an empty list of slots writes nothing rather than a blank line
+    if lines:
+        sys.stdout.write(lines + "\n")
+
 events = []
 events.append(EventSlot(start_time=datetime.strptime("13/03/2023 15:00", format), end_time=datetime.strptime("14/03/2023 09:00", format)))
 events.append(EventSlot(start_time=datetime.strptime("14/03/2023 12:00", format)))
@@ -20,13 +26,11 @@ end_wknd = datetime.strptime("31/03/2023 18:00", format)
 
 all_slots = TimeSlot(start_time=start_wknd, end_time=end_wknd, business_hours=BusinessHours()).by(timedelta(hours=1)).as_event()
 len_all_slots = len(all_slots)
-for slot in all_slots:
-    print("Slots Generated --->", slot)
+write_lines(all_slots.format_all("Slots Generated ---> "))
 
 all_slots.remove(events)
 len_free_slots = len(all_slots)
-for slot in all_slots:
-    print("Free Slots --->", slot)
+write_lines(all_slots.format_all("Free Slots ---> "))
 
 print("Events: {}, Slots Generated: {}, Free Slots: {}".format(len_events, len_all_slots, len_free_slots))
 
@@ -48,5 +52,4 @@ calendar.generate_slots(start_time=start_wknd, duration=timedelta(minutes=40), g
 calendar.add_event(start_time=datetime.strptime("14/03/2023 15:00", format))
 
 slots = calendar.get_slots().as_event()
-for slot in slots:
-    print("Free Slots --->", slot)
\ No newline at end of file
+write_lines(slots.format_all("Free Slots ---> "))
\ No newline at end of file
@@ -0,0 +1,36 @@
+import random
+import unittest
+
+from timeslots._intervals import SortedIntervals
+
+class SortedIntervalsTest(unittest.TestCase):
+
+    def test_random_add_remove(self):
+        rnd = random.Random(3)
+        intervals, items = SortedIntervals(), []
+        for _ in range(2000):
+            if rnd.random() < 0.6 or not items:
+                lo = rnd.randrange(100)
+                item = (lo, lo + rnd.randrange(20), object())
+                intervals.add(*item)
+                items.append(item)
+            else:
+                intervals.remove(*items.pop(rnd.randrange(len(items))))
+
+            keys = [(lo, hi) for lo, hi, _ in intervals.intervals()]
+            self.assertEqual(keys, sorted(keys))
+            self.assertEqual(len(intervals), len(items))
+        self.assertEqual(sorted(map(id, intervals)), sorted(id(item) for _, _, item in items))
+
+    def test_shared_interval(self):
+        first, second = object(), object()
+        intervals = SortedIntervals().add(1, 2, first).add(0, 5, object()).add(1, 2, second)
+        self.assertEqual(list(intervals)[1:], [first, second])
+
+        intervals.remove(1, 2, second)
+        self.assertEqual(list(intervals)[1:], [first])
+        with self.assertRaises(ValueError):
+            intervals.remove(1, 2, second)
+
+if __name__ == '__main__':
+    unittest.main()
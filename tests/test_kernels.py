@@ -0,0 +1,47 @@
+import random
+import unittest
+
+from timeslots._kernels import DAY, free_starts, grid_starts, weekday
+
+HOUR = DAY // 24
+
+class KernelsTest(unittest.TestCase):
+
+    def test_weekday(self):
+        # 1970-01-01 was a thursday, 1970-01-05 a monday
+        self.assertEqual(weekday(0), 3)
+        self.assertEqual(weekday(4), 0)
+
+    def test_grid_starts(self):
+        rnd = random.Random(1)
+        for _ in range(200):
+            base = rnd.randrange(20 * DAY)
+            end = base + rnd.randrange(4 * DAY)
+            step = rnd.randrange(1, 6) * HOUR // 2
+            windows = []
+            for _ in range(7):
+                first = rnd.randrange(DAY)
+                windows.append((first, first + rnd.randrange(-HOUR, DAY - first)))
+
+            expected = [start for start in range(base, end + 1, step) if windows[weekday(start // DAY)][0] <= start % DAY <= windows[weekday(start // DAY)][1]]
+            self.assertEqual(list(grid_starts(base, end, step, windows)), expected)
+
+    def test_free_starts(self):
+        rnd = random.Random(2)
+        for _ in range(200):
+            duration = rnd.randrange(1, 4) * HOUR // 2
+            starts = sorted(rnd.sample(range(0, 100 * HOUR, HOUR // 4), rnd.randrange(50)))
+            events = sorted((start, start + rnd.randrange(0, 3 * HOUR)) for start in (rnd.randrange(100 * HOUR) for _ in range(rnd.randrange(20))))
+            offset = rnd.choice([None, lambda timestamp: HOUR, lambda timestamp: HOUR if timestamp % DAY < DAY // 2 else 2 * HOUR])
+
+            def overlapping(start):
+                lo, hi = start, start + duration
+                if offset is not None:
+                    lo, hi = lo - offset(lo), hi - offset(hi)
+                return any(event_start < hi and event_end > lo for event_start, event_end in events)
+
+            expected = [start for start in starts if not overlapping(start)]
+            self.assertEqual(list(free_starts(starts, duration, [start for start, _ in events], [end for _, end in events], offset)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
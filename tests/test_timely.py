@@ -0,0 +1,153 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from timeslots.timely import BusinessHours, Calendar, EventInfo, EventSlot, TimeSlot
+
+def _times(*times: str) -> list:
+    return [datetime.strptime(time, "%d/%m/%Y %H:%M") for time in times]
+
+class TimeSlotTest(unittest.TestCase):
+
+    def test_business_hours(self):
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 17, 0), end_time=datetime(2023, 3, 14, 9, 0), business_hours=BusinessHours())
+        self.assertEqual(list(slots), _times("13/03/2023 17:00", "13/03/2023 17:30", "14/03/2023 08:00", "14/03/2023 08:30", "14/03/2023 09:00"))
+
+    def test_days_off(self):
+        slots = TimeSlot(start_time=datetime(2023, 3, 17, 17, 0), end_time=datetime(2023, 3, 20, 8, 30), business_hours=BusinessHours())
+        self.assertEqual(list(slots), _times("17/03/2023 17:00", "17/03/2023 17:30", "20/03/2023 08:00", "20/03/2023 08:30"))
+
+    def test_business_hours_as_lists(self):
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 9, 0), end_time=datetime(2023, 3, 13, 11, 0), business_hours=BusinessHours(monday=["09:00", "10:00"]))
+        self.assertEqual(list(slots), _times("13/03/2023 09:00", "13/03/2023 09:30"))
+
+    def test_gap(self):
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 9, 0), end_time=datetime(2023, 3, 13, 11, 0), duration=timedelta(minutes=40), gap=timedelta(minutes=20))
+        self.assertEqual(list(slots), _times("13/03/2023 09:00", "13/03/2023 10:00", "13/03/2023 11:00"))
+
+    def test_microsecond_start(self):
+        # slots start on whole seconds, from the first one not before the start time
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 9, 0, 5, 250000), end_time=datetime(2023, 3, 13, 10, 30))
+        self.assertEqual(list(slots), [datetime(2023, 3, 13, 9, 30, 5), datetime(2023, 3, 13, 10, 0, 5)])
+
+    def test_day_crossing(self):
+        # a slot must end on the day it starts
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 23, 0), end_time=datetime(2023, 3, 14, 1, 0))
+        self.assertEqual(list(slots), _times("13/03/2023 23:00", "14/03/2023 00:00", "14/03/2023 00:30", "14/03/2023 01:00"))
+        self.assertEqual(len(slots), 4)
+        self.assertEqual(slots[-1], datetime(2023, 3, 14, 1, 0))
+
+    def test_remove_events(self):
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 9, 0), end_time=datetime(2023, 3, 13, 12, 0))
+        slots.remove([EventSlot(start_time=datetime(2023, 3, 13, 9, 45)), EventSlot(start_time=datetime(2023, 3, 13, 11, 0), end_time=datetime(2023, 3, 13, 11, 1))])
+        self.assertEqual(list(slots), _times("13/03/2023 09:00", "13/03/2023 10:30", "13/03/2023 11:30", "13/03/2023 12:00"))
+
+        # removing from the materialized slots gives the same result as from the streamed ones
+        slots.remove(EventSlot(start_time=datetime(2023, 3, 13, 12, 0)))
+        self.assertEqual(len(slots), 3)
+        slots.remove(TimeSlot(start_time=datetime(2023, 3, 13, 9, 0), end_time=datetime(2023, 3, 13, 9, 0)))
+        self.assertEqual(list(slots), _times("13/03/2023 10:30", "13/03/2023 11:30"))
+
+    def test_remove_aware_events(self):
+        utc, paris = timezone.utc, timezone(timedelta(hours=2))
+        slots = TimeSlot(start_time=datetime(2023, 3, 13, 9, 0, tzinfo=utc), end_time=datetime(2023, 3, 13, 11, 0, tzinfo=utc))
+        slots.remove(EventSlot(start_time=datetime(2023, 3, 13, 11, 0, tzinfo=paris), end_time=datetime(2023, 3, 13, 12, 0, tzinfo=paris)))
+        self.assertEqual(list(slots), [datetime(2023, 3, 13, 10, 0, tzinfo=utc), datetime(2023, 3, 13, 10, 30, tzinfo=utc), datetime(2023, 3, 13, 11, 0, tzinfo=utc)])
+
+        with self.assertRaises(TypeError):
+            slots.remove(EventSlot(start_time=datetime(2023, 3, 13, 10, 0)))
+
+    def test_event_slots_are_kept(self):
+        slots = TimeSlot(start_time=datetime(2023, 1, 2, 9, 0), end_time=datetime(2023, 1, 2, 10, 0)).as_event()
+        for slot in slots:
+            slot.info = EventInfo("Meeting", "Weekly", {"summary": "Meeting"})
+        slots.remove(EventSlot(start_time=datetime(2023, 1, 2, 9, 30)))
+
+        self.assertEqual([slot["info"] for slot in slots.to_json()], [{"name": "Meeting", "description": "Weekly"}] * 2)
+        self.assertEqual([str(slot.get("summary")) for slot in slots.to_ics()], ["Meeting"] * 2)
+        self.assertIs(slots[1].info, slots[1].info)
+
+class EventSlotTest(unittest.TestCase):
+
+    def test_aware_overlapping(self):
+        slot = EventSlot(start_time=datetime(2023, 3, 13, 10, 0, tzinfo=timezone.utc), end_time=datetime(2023, 3, 13, 11, 0, tzinfo=timezone.utc))
+        paris = timezone(timedelta(hours=2))
+        self.assertTrue(slot.is_overlapping(EventSlot(start_time=datetime(2023, 3, 13, 12, 0, tzinfo=paris), end_time=datetime(2023, 3, 13, 13, 0, tzinfo=paris))))
+        self.assertFalse(slot.is_overlapping(EventSlot(start_time=datetime(2023, 3, 13, 13, 0, tzinfo=paris), end_time=datetime(2023, 3, 13, 14, 0, tzinfo=paris))))
+
+        with self.assertRaises(TypeError):
+            slot.is_overlapping(EventSlot(start_time=datetime(2023, 3, 13, 10, 0)))
+
+class CalendarTest(unittest.TestCase):
+
+    def test_slots(self):
+        calendar = Calendar(business_hours=BusinessHours(monday=None))
+        calendar.add_event(start_time=datetime(2023, 3, 14, 9, 0))
+        calendar.add_event(start_time=datetime(2023, 3, 14, 10, 0), duration=timedelta(hours=1))
+        calendar.generate_slots(start_time=datetime(2023, 3, 13, 12, 0), end_time=datetime(2023, 3, 14, 12, 0), duration=timedelta(minutes=45), gap=timedelta(minutes=15))
+
+        self.assertEqual(list(calendar.get_slots()), _times("14/03/2023 08:00", "14/03/2023 11:00", "14/03/2023 12:00"))
+
+        calendar.add_event(start_time=datetime(2023, 3, 14, 11, 30))
+        self.assertEqual(list(calendar.get_slots()), _times("14/03/2023 08:00", "14/03/2023 12:00"))
+
+        calendar.remove_event(calendar.get_events()[0])
+        self.assertEqual(list(calendar.get_slots()), _times("14/03/2023 08:00", "14/03/2023 09:00", "14/03/2023 12:00"))
+        self.assertEqual([str(slot) for slot in calendar.iter_free_slots()], ["14/03/2023 from 08:00 to 08:45", "14/03/2023 from 09:00 to 09:45", "14/03/2023 from 12:00 to 12:45"])
+
+    def test_events_in_order(self):
+        late, early = EventSlot(start_time=datetime(2023, 3, 14, 12, 0)), EventSlot(start_time=datetime(2023, 3, 14, 9, 0))
+        calendar = Calendar().import_events([late, early])
+        self.assertEqual(calendar.get_events(), [early, late])
+
+        calendar.purge_events([late, early])
+        self.assertEqual(calendar.get_events(), [])
+        with self.assertRaises(ValueError):
+            calendar.remove_event(late)
+
+    def test_remove_extended_event(self):
+        event = EventSlot(start_time=datetime(2023, 1, 2, 9, 0), end_time=datetime(2023, 1, 2, 9, 30))
+        calendar = Calendar().add_event(event).generate_slots(datetime(2023, 1, 2, 9, 0), datetime(2023, 1, 2, 11, 0))
+
+        event.extends(timedelta(hours=1))
+        calendar.remove_event(event)
+
+        self.assertEqual(calendar.get_events(), [])
+        self.assertEqual(len(calendar.get_slots()), 5)
+
+    def test_slots_follow_extended_event(self):
+        event = EventSlot(start_time=datetime(2023, 1, 2, 9, 0), end_time=datetime(2023, 1, 2, 9, 30))
+        calendar = Calendar().add_event(event).generate_slots(datetime(2023, 1, 2, 9, 0), datetime(2023, 1, 2, 11, 0))
+
+        calendar.get_slots()
+        event.extends(timedelta(hours=1))
+
+        self.assertEqual([str(slot) for slot in calendar.iter_free_slots()], ['02/01/2023 from 10:30 to 11:00', '02/01/2023 from 11:00 to 11:30'])
+        calendar.add_event(start_time=datetime(2023, 1, 2, 11, 0))
+        self.assertEqual(list(calendar.get_slots()), [datetime(2023, 1, 2, 10, 30)])
+
+    def test_regenerate_unchanged_slots(self):
+        calendar = Calendar().generate_slots(datetime(2023, 1, 2, 9, 0), datetime(2023, 1, 2, 11, 0))
+        slots = calendar.get_slots()
+        self.assertIs(calendar.get_slots(), slots)
+
+        # regenerating the same slots still leaves out the changes made to the returned ones
+        slots.remove(EventSlot(start_time=datetime(2023, 1, 2, 9, 0)))
+        calendar.purge_events([])
+        self.assertEqual(len(calendar.get_slots()), 5)
+        slots = calendar.get_slots()
+
+        # only the added event is removed from the slots, the returned ones are left as they were
+        calendar.add_event(start_time=datetime(2023, 1, 2, 9, 0))
+        self.assertEqual(len(calendar.get_slots()), 4)
+        self.assertEqual(len(slots), 5)
+
+    def test_returned_slots_are_kept(self):
+        calendar = Calendar().generate_slots(datetime(2023, 1, 2, 9, 0), datetime(2023, 1, 2, 11, 0))
+        slots = calendar.get_slots().as_event()
+
+        calendar.add_event(start_time=datetime(2023, 1, 2, 9, 0))
+        self.assertEqual(len(slots), 5)
+        self.assertEqual(list(calendar.get_slots()), [datetime(2023, 1, 2, 9, 30), datetime(2023, 1, 2, 10, 0), datetime(2023, 1, 2, 10, 30), datetime(2023, 1, 2, 11, 0)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, Tuple
+
+class SortedIntervals:
+    """
+    Intervals ordered by start then end, each holding an item, kept sorted by bisection.
+    Intervals are half open, ``[lo, hi)``, and several items can share the same interval.
+    """
+    def __init__(self):
+        self.__keys: list = []
+        self.__items: list = []
+
+    def __len__(self):
+        """
+        Number of items.
+        """
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterator over the items, ordered by interval.
+        """
+        return iter(self.__items)
+
+    def intervals(self) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Iterator over the (lo, hi, item), ordered by interval.
+        """
+        for (lo, hi), item in zip(self.__keys, self.__items):
+            yield lo, hi, item
+
+    def add(self, lo: int, hi: int, item: Any) -> 'SortedIntervals':
+        """
+        Adds an item for the given interval, after the items sharing it.
+
+        :param lo: start of the interval
+        :param hi: end of the interval
+        :param item: item to add
+        :return: the intervals
+        """
+        index = bisect_right(self.__keys, (lo, hi))
+        self.__keys.insert(index, (lo, hi))
+        self.__items.insert(index, item)
+        return self
+
+    def remove(self, lo: int, hi: int, item: Any) -> 'SortedIntervals':
+        """
+        Removes an item previously added for the given interval.
+
+        :param lo: start of the interval
+        :param hi: end of the interval
+        :param item: item to remove
+        :return: the intervals
+        """
+        index = bisect_left(self.__keys, (lo, hi))
+        while index < len(self.__keys) and self.__keys[index] == (lo, hi):
+            if self.__items[index] is item:
+                del self.__keys[index]
+                del self.__items[index]
+                return self
+            index += 1
+        raise ValueError("Item not in intervals")
@@ -0,0 +1,56 @@
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Callable, Iterable, Iterator
+
+# microseconds in a day
+DAY = 24 * 60 * 60 * 1000000
+
+def weekday(day: int) -> int:
+    """
+    Day of the week of a day counted from the epoch, monday being 0.
+
+    :param day: number of days since the epoch
+    :return: the day of the week
+    """
+    # the epoch was a thursday
+    return (day + 3) % 7
+
+def grid_starts(base: int, end: int, step: int, windows: list) -> Iterator[int]:
+    """
+    Start timestamps of the grid ``base + k * step`` up to ``end`` falling in the window of their day.
+
+    :param base: first timestamp of the grid
+    :param end: last timestamp a slot can start at
+    :param step: interval of the grid
+    :param windows: list of (first, last) time of the day a slot can start at, one per day of the week starting on monday
+    :return: iterator over the start timestamps, in increasing order
+    """
+    for day in range(base // DAY, end // DAY + 1):
+        first, last = windows[weekday(day)]
+        after = max(day * DAY + first, base)
+        before = min(day * DAY + last, end)
+        if after <= before:
+            # first point of the grid at or after the window
+            yield from range(base - (base - after) // step * step, before + 1, step)
+
+def free_starts(starts: Iterable[int], duration: int, event_starts: list, event_ends: list, offset: Callable[[int], int] = None) -> Iterator[int]:
+    """
+    Start timestamps of the slots not overlapping with any event.
+
+    :param starts: start timestamps of the slots
+    :param duration: duration of the slots
+    :param event_starts: start timestamps of the events, in increasing order
+    :param event_ends: end timestamps of the events, in the order of ``event_starts``
+    :param offset: function returning the UTC offset at a timestamp of the slots, subtracted to compare them with the events (default: None, i.e. no offset)
+    :return: iterator over the start timestamps of the free slots
+    """
+    # latest end among the events up to each one
+    latest = list(accumulate(event_ends, max))
+    for start in starts:
+        lo, hi = start, start + duration
+        if offset is not None:
+            lo, hi = lo - offset(lo), hi - offset(hi)
+        # events starting before the slot ends
+        count = bisect_left(event_starts, hi)
+        if count == 0 or latest[count - 1] <= lo:
+            yield start
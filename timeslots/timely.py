@@ -1,8 +1,88 @@
 import icalendar
+from array import array
+from functools import lru_cache
+from itertools import count
 from uuid import uuid4
-from typing import Optional, Tuple, NamedTuple
-from datetime import datetime, timedelta
-from dateutil.rrule import rrule, rruleset, rrulestr, WEEKLY, MO, TU, WE, TH, FR, SA, SU
+from typing import Callable, Optional, Tuple, NamedTuple
+from datetime import datetime, timedelta, timezone
+from dateutil.rrule import rrule, rruleset, MINUTELY, WEEKLY, MO, TU, WE, TH, FR, SA, SU
+from ._intervals import SortedIntervals
+from ._kernels import DAY as _DAY, free_starts, grid_starts, weekday
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _timestamp(dt: datetime) -> int:
+    """
+    Microseconds elapsed since the epoch, in UTC if the given datetime is aware, to compare instants.
+
+    :param dt: datetime to convert
+    :return: the timestamp
+    """
+    offset = dt.utcoffset()
+    wall = dt.replace(tzinfo=None)
+    return ((wall - offset if offset is not None else wall) - _EPOCH) // _MICROSECOND
+
+def _wall_timestamp(dt: datetime) -> int:
+    """
+    Microseconds elapsed since the epoch, read on the wall clock of the given datetime, to get its day and time of the day.
+
+    :param dt: datetime to convert
+    :return: the timestamp
+    """
+    return (dt.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+
+def _check_comparable(dt: datetime, other: datetime) -> None:
+    """
+    Raises a TypeError, as comparing them would, if one of the given datetimes is naive and the other aware.
+
+    :param dt: first datetime
+    :param other: second datetime
+    """
+    if (dt.tzinfo is None) is not (other.tzinfo is None):
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+def _uid_generator() -> Callable[[], str]:
+    """
+    Returns a generator of unique ids sharing a single random uuid, suffixed by a counter.
+
+    :return: function returning a new unique id on each call
+    """
+    base, counter = uuid4(), count()
+    return lambda: "{}-{}".format(base, next(counter))
+
+@lru_cache(maxsize=128)
+def _business_table(hours: tuple) -> tuple:
+    """
+    Parses business hours into times of the day.
+
+    :param hours: business hours, one ("HH:MM", "HH:MM") tuple or None per day of the week
+    :return: tuple of (start, end) time of the day in microseconds or None, one per day of the week
+    """
+    return tuple(
+        tuple(_wall_timestamp(datetime.strptime(hour, '%H:%M')) % _DAY for hour in day) if day is not None else None
+        for day in hours
+    )
+
+@lru_cache(maxsize=128)
+def _slot_windows(duration: int, table: tuple = None) -> tuple:
+    """
+    Returns, for each day of the week, the first and last time of the day a slot can start at.
+    A slot must end on the day it starts and, if any, within the business hours of that day.
+
+    :param duration: duration of the slots in microseconds
+    :param table: parsed business hours, see ``BusinessHours._table`` (default: None, i.e. the whole day)
+    :return: tuple of (first, last) time of the day in microseconds, one per day of the week
+    """
+    last = _DAY - duration - 1
+
+    if table is None:
+        return ((0, last),) * 7
+
+    return tuple(
+        (hours[0], min(hours[1] - duration, last)) if hours is not None else (1, 0)
+        for hours in table
+    )
 
 class BusinessHours(NamedTuple):
     """"
@@ -24,23 +104,36 @@ class BusinessHours(NamedTuple):
         :param dt_before: datetime to check before at
         :return: True if the datetime is in business hours, False otherwise
         """
-        if self[dt_after.weekday()] is not None:
-            _after = datetime.strptime(self[dt_after.weekday()][0], '%H:%M').time()
-            _before =datetime.strptime(self[dt_after.weekday()][1], '%H:%M').time()
-            return _after <= dt_after.time() and dt_before.time() <= _before
+        day, time = divmod(_wall_timestamp(dt_after), _DAY)
+        hours = self._table[weekday(day)]
+        if hours is not None:
+            _after, _before = hours
+            return _after <= time and _wall_timestamp(dt_before) % _DAY <= _before
         else:
             return False
 
+    @property
+    def _table(self) -> tuple:
+        """
+        Business hours as (start, end) time of the day in microseconds, parsed once per distinct business hours.
+        """
+        # days may be given as lists, which cannot be cache keys
+        return _business_table(tuple(tuple(day) if day is not None else None for day in self))
+
 class EventInfo:
     """
     Event info class.
     
     :param name: name of the event
     :param description: description of the event
+    :param properties: iCal properties of the event (default: None)
     """
-    def __init__(self, name: str, description: str):
+    __slots__ = ('name', 'description', 'properties')
+
+    def __init__(self, name: str, description: str, properties: dict = None):
         self.name = name
         self.description = description
+        self.properties = properties if properties else {}
 
     def __str__(self):
         return "{} - {}".format(self.name, self.description)
@@ -60,12 +153,38 @@ class EventSlot:
     :param duration: duration of the event slot
     :param info: info of the event slot
     """
+    __slots__ = ('_start_time', '_end_time', 'duration', 'info', '_s', '_e')
+
     def __init__(self, start_time: datetime, end_time: datetime = None, duration: timedelta = None, info: EventInfo = None):
         self.duration = duration if duration else timedelta(minutes=30)
         self.start_time = start_time
         self.end_time = end_time if end_time else start_time + self.duration
         self.info = info
 
+    @property
+    def start_time(self) -> datetime:
+        """
+        Start time of the event slot.
+        """
+        return self._start_time
+
+    @start_time.setter
+    def start_time(self, start_time: datetime):
+        self._start_time = start_time
+        self._s = _timestamp(start_time)
+
+    @property
+    def end_time(self) -> datetime:
+        """
+        End time of the event slot.
+        """
+        return self._end_time
+
+    @end_time.setter
+    def end_time(self, end_time: datetime):
+        self._end_time = end_time
+        self._e = _timestamp(end_time)
+
     def __str__(self):
         """
         String representation of the event slot.
@@ -77,10 +196,11 @@ class EventSlot:
         >>> EventSlot(start_time=datetime(2020, 1, 1, 10, 0, 0), end_time=datetime(2020, 1, 2, 11, 0, 0)).__str__()
         '01/01/2020 from 10:00 to 02/01/2020 at 11:00'
         """
-        if self.start_time.date() == self.end_time.date():
-            return "{} from {} to {}".format(datetime.date(self.start_time).strftime("%d/%m/%Y"), datetime.time(self.start_time).strftime("%H:%M"), datetime.time(self.end_time).strftime("%H:%M"))
+        start, end = self.start_time, self.end_time
+        if start.date() == end.date():
+            return f"{start.day:02d}/{start.month:02d}/{start.year} from {start.hour:02d}:{start.minute:02d} to {end.hour:02d}:{end.minute:02d}"
         else:
-            return "{} from {} to {} at {}".format(datetime.date(self.start_time).strftime("%d/%m/%Y"), datetime.time(self.start_time).strftime("%H:%M"), datetime.date(self.end_time).strftime("%d/%m/%Y"), datetime.time(self.end_time).strftime("%H:%M"))
+            return f"{start.day:02d}/{start.month:02d}/{start.year} from {start.hour:02d}:{start.minute:02d} to {end.day:02d}/{end.month:02d}/{end.year} at {end.hour:02d}:{end.minute:02d}"
 
     def extends(self, duration: timedelta) -> 'EventSlot':
         """
@@ -104,7 +224,9 @@ class EventSlot:
         >>> EventSlot(start_time=datetime(2020, 1, 1, 10, 0, 0), end_time=datetime(2020, 1, 1, 11, 0, 0)).is_overlapping(EventSlot(start_time=datetime(2020, 1, 1, 11, 0, 0), end_time=datetime(2020, 1, 1, 12, 0, 0)))
         False
         """
-        return self.start_time < other.end_time and self.end_time > other.start_time
+        if (self._start_time.tzinfo is None) is not (other._start_time.tzinfo is None):
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+        return self._s < other._e and self._e > other._s
 
     def to_json(self) -> dict:
         """
@@ -120,22 +242,27 @@ class EventSlot:
             "info": self.info.to_json() if self.info else None
         }
     
-    def to_ics(self) -> icalendar.Event:
+    def to_ics(self, busy: bool = True, dtstamp: datetime = None, uid_gen: Callable[[], str] = None) -> icalendar.Event:
         """
         iCal representation of the event slot.
         
+        :param busy: whether the event slot is busy or free (default: True)
+        :param dtstamp: creation time of the iCal event, shared by a whole export (default: None, i.e. now)
+        :param uid_gen: function returning the UID of the event if it has none, shared by a whole export (default: None, i.e. a random UID)
         :return: iCal representation of the event slot"""
         event = icalendar.Event()
 
-        self.info.properties = self.info.properties if self.info.properties else {}
-        self.info.properties['X-MICROSOFT-CDO-BUSYSTATUS'] = 'BUSY' if self.info.busy else 'FREE'
-        self.info.properties['UID'] = uuid4() if 'UID' not in self.info.properties else self.info.properties['UID']
+        properties = self.info.properties if self.info else {}
+        properties['X-MICROSOFT-CDO-BUSYSTATUS'] = 'BUSY' if busy else 'FREE'
+        if 'UID' not in properties:
+            properties['UID'] = uid_gen() if uid_gen else str(uuid4())
 
-        map(lambda x: event.add(x, self.info.properties[x]), self.info.properties.keys())
+        for key, value in properties.items():
+            event.add(key, value)
 
-        event.add('dtstamp', datetime.utcnow())
-        event.begin = self.start_time
-        event.end = self.end_time
+        event.add('dtstamp', dtstamp if dtstamp else datetime.utcnow())
+        event.add('dtstart', self.start_time)
+        event.add('dtend', self.end_time)
         return event
 
 class TimeSlot:
@@ -146,35 +273,68 @@ class TimeSlot:
     :param end_time: end time of the time slot (default: 23:59:59)
     :param duration: duration of the time slot (default: 30 minutes)
     :param gap: gap between two time slots (default: 0 minutes)
-    :param booked_slots: list of booked slots (default: [], i.e. no booked slots are present)
+    :param booked_slots: list of booked slots (default: None, i.e. no booked slots are present)
     """
-    def __init__(self, start_time: datetime = None, end_time: datetime = None, business_hours: BusinessHours = None, duration: timedelta = None, gap: timedelta = None, booked_slots: list = []):
-        __date: datetime = datetime.utcnow()
-        self.__start_time = start_time if start_time else datetime(__date.year, __date.month, __date.day, 0, 0, 0)
-        self.__end_time = end_time if end_time else datetime(__date.year, __date.month, __date.day, 23, 59, 59)
+    __slots__ = ('__start_time', '__end_time', '__origin', '__base', 'slot_duration', '__duration', '__gap', '__business_hours', '__step', '__grid', '__removals', '__starts', '__as_events', '__event_list', '__rule')
+
+    def __init__(self, start_time: datetime = None, end_time: datetime = None, business_hours: BusinessHours = None, duration: timedelta = None, gap: timedelta = None, booked_slots: list = None):
+        if start_time is None or end_time is None:
+            __date: datetime = datetime.utcnow()
+            start_time = start_time if start_time else datetime(__date.year, __date.month, __date.day, 0, 0, 0)
+            end_time = end_time if end_time else datetime(__date.year, __date.month, __date.day, 23, 59, 59)
+        self.__start_time = start_time
+        self.__end_time = end_time
         
-        difference = self.__end_time - self.__start_time
-        self.slot_duration = timedelta(minutes=difference.seconds // 60)
+        self.slot_duration = self.__end_time - self.__start_time
         self.__duration = duration if duration else timedelta(minutes=30)
         self.__gap = gap if gap else timedelta(minutes=0)
 
         self.__business_hours = business_hours
-        self.rule = self.__rrulestr()
+        self.__step = self.__interval()
+        self.__rule: rrule = None
         self.by()
 
-        self.remove(booked_slots)
+        if booked_slots:
+            self.remove(booked_slots)
 
     def __iter__(self):
         """
         Iterator for the time slot.
         """
-        return self.__slots.__iter__()
+        return self.iter_slots()
     
     def __len__(self):
         """
         Length of the time slot.
         """
-        return len(self.__slots)
+        return len(self.__materialize())
+
+    def __getitem__(self, index: int):
+        """
+        Slot at the given index.
+        """
+        if self.__as_events:
+            return self.__kept_events()[index]
+        return self.__datetime(self.__materialize()[index])
+
+    def iter_slots(self):
+        """
+        Iterator over the slots, as datetimes or as event slots.
+        Until the slots are counted, indexed or iterated as events, they are computed as they are reached without building the whole list.
+        Event slots are built once, so that changes made to them (e.g. their info) are kept by the time slot.
+
+        :return: the iterator
+        """
+        return iter(self.__kept_events()) if self.__as_events else self.__datetimes()
+
+    @property
+    def rule(self) -> rrule:
+        """
+        Recurrence rule of the time slot, built on first use (slot generation does not use it) and kept with the time slot.
+        """
+        if self.__rule is None:
+            self.__rule = self.__rrulestr()
+        return self.__rule
 
     def extends(self, duration: timedelta) -> 'TimeSlot':
         """
@@ -204,8 +364,7 @@ class TimeSlot:
 
         :return: the time slot
         """
-        if len(self.__slots) > 0 and isinstance(self.__slots[0], datetime):
-            self.__slots = list(map(lambda __start: EventSlot(start_time=__start, duration=self.__duration), self.__slots))
+        self.__as_events = True
         return self
     
     def as_list(self) -> 'TimeSlot':
@@ -214,37 +373,47 @@ class TimeSlot:
         
         :return: the time slot
         """
-        if isinstance(self.__slots[0], EventSlot):
-            self.__slots = list(map(lambda event: event.start_time, self.__slots))
+        self.__as_events = False
+        self.__event_list = None
         return self
+
+    def copy(self) -> 'TimeSlot':
+        """
+        Returns a copy of the time slot as a list, changed independently from this one.
+
+        :return: the copy
+        """
+        copy = TimeSlot.__new__(TimeSlot)
+        copy.__start_time, copy.__end_time = self.__start_time, self.__end_time
+        copy.__origin, copy.__base = self.__origin, self.__base
+        copy.slot_duration, copy.__duration, copy.__gap = self.slot_duration, self.__duration, self.__gap
+        copy.__business_hours, copy.__step, copy.__grid = self.__business_hours, self.__step, self.__grid
+        copy.__removals = list(self.__removals)
+        copy.__starts = array('q', self.__starts) if self.__starts is not None else None
+        copy.__as_events, copy.__event_list, copy.__rule = False, None, None
+        return copy
     
     def remove(self, object) -> 'TimeSlot':
         """"
         Removes the given object from the time slot.
         
-        :param object: object to remove from the time slot (can be a list of objects, an event slot or a time slot)
+        :param object: object to remove from the time slot (can be a list of objects, an event slot, a time slot or sorted intervals of events)
         :return: the time slot
         """
-        if len(self.__slots) == 0:
+        if self.__starts is not None and len(self.__starts) == 0:
             return self
-        
-        slots_type = type(self.__slots[0])
-        if slots_type == datetime:
-            self.as_event()
 
-        try:
-            if isinstance(object, EventSlot):
-                return self.remove_event(object)
-            elif isinstance(object, list):
-                return self.remove_events(object)
-            elif isinstance(object, TimeSlot):
-                return self.remove_events(object.__slots)
-            else:
-                raise Exception("Invalid object type")
-        finally:
-            if slots_type == datetime:
-                self.as_list()
-        
+        if isinstance(object, EventSlot):
+            return self.remove_event(object)
+        elif isinstance(object, list):
+            return self.remove_events(object)
+        elif isinstance(object, TimeSlot):
+            _check_comparable(self.__start_time, object.__start_time)
+            return self.__remove_intervals(object.__intervals())
+        elif isinstance(object, SortedIntervals):
+            return self.__remove_sorted_intervals(object)
+        else:
+            raise Exception("Invalid object type")
 
     def remove_event(self, event) -> 'TimeSlot':
         """
@@ -262,9 +431,145 @@ class TimeSlot:
         :param events: events to remove from the time slot (list of events)
         :return: the time slot
         """
-        self.__slots = list(filter(lambda x: not self.__is_overlapping_events(x, events), self.__slots))
-        return self
+        return self.__remove_intervals(self.__event_intervals(events))
+
+    def __event_intervals(self, events):
+        """
+        Iterator over the (start, end) timestamps of the given events, which must be comparable with the slots.
+        """
+        for event in events:
+            _check_comparable(self.__start_time, event._start_time)
+            yield event._s, event._e
+
+    def __remove_intervals(self, intervals) -> 'TimeSlot':
+        """
+        Removes the slots overlapping with any of the given intervals.
+
+        :param intervals: (start, end) timestamps to remove from the time slot
+        :return: the time slot
+        """
+        intervals = sorted(intervals)
+        return self.__remove_sorted([start for start, _ in intervals], [end for _, end in intervals])
     
+    def __remove_sorted_intervals(self, intervals: SortedIntervals) -> 'TimeSlot':
+        """
+        Removes the slots overlapping with any of the given intervals.
+
+        :param intervals: sorted intervals of the events, keyed by timestamp
+        :return: the time slot
+        """
+        # the intervals are already ordered by start, no sort is needed
+        starts, ends = [], []
+        for start, end, event in intervals.intervals():
+            _check_comparable(self.__start_time, event._start_time)
+            starts.append(start)
+            ends.append(end)
+        return self.__remove_sorted(starts, ends)
+
+    def __remove_sorted(self, starts: list, ends: list) -> 'TimeSlot':
+        """
+        Removes the slots overlapping with any of the given intervals, right away if the slots are materialized or else when they are iterated.
+
+        :param starts: start timestamps of the intervals, in increasing order
+        :param ends: end timestamps of the intervals, in the order of ``starts``
+        :return: the time slot
+        """
+        if not starts:
+            return self
+
+        removal = (self.__duration // _MICROSECOND, starts, ends, self.__utc_offset())
+        if self.__starts is None:
+            self.__removals.append(removal)
+            return self
+
+        starts = array('q', free_starts(self.__starts, *removal))
+        if self.__event_list is not None:
+            kept = set(starts)
+            self.__event_list = [event for start, event in zip(self.__starts, self.__event_list) if start in kept]
+        self.__starts = starts
+        return self
+
+    def __iter_starts(self):
+        """
+        Iterator over the start timestamps of the slots, streamed from the grid through the removals if not materialized.
+        """
+        if self.__starts is not None:
+            return iter(self.__starts)
+
+        starts = grid_starts(*self.__grid)
+        for removal in self.__removals:
+            starts = free_starts(starts, *removal)
+        return starts
+
+    def __materialize(self) -> array:
+        """
+        Stores the start timestamps of the slots in an array, computing them if needed.
+
+        :return: the array of start timestamps
+        """
+        if self.__starts is None:
+            self.__starts = array('q', self.__iter_starts())
+            self.__removals = []
+        return self.__starts
+
+    def __datetime(self, timestamp: int) -> datetime:
+        """
+        Converts a timestamp of the time slot back to a datetime.
+
+        :param timestamp: timestamp to convert
+        :return: the datetime
+        """
+        return self.__origin + timedelta(microseconds=timestamp - self.__base)
+
+    def __datetimes(self):
+        """
+        Iterator over the start times of the slots.
+        """
+        for timestamp in self.__iter_starts():
+            yield self.__datetime(timestamp)
+
+    def __event_slots(self):
+        """
+        Iterator over the slots as event slots, the kept ones if any or else built as they are reached.
+        """
+        if self.__event_list is not None:
+            return iter(self.__event_list)
+        return (EventSlot(start_time=start, duration=self.__duration) for start in self.__datetimes())
+
+    def __kept_events(self) -> list:
+        """
+        Returns the slots as event slots, built on first use and kept until the slots are generated again.
+
+        :return: list of event slots
+        """
+        if self.__event_list is None:
+            self.__event_list = [EventSlot(start_time=self.__datetime(start), duration=self.__duration) for start in self.__materialize()]
+        return self.__event_list
+
+    def __intervals(self):
+        """
+        Iterator over the (start, end) timestamps of the slots, comparable with those of the events.
+        """
+        duration, offset = self.__duration // _MICROSECOND, self.__utc_offset()
+        for start in self.__iter_starts():
+            end = start + duration
+            yield (start - offset(start), end - offset(end)) if offset else (start, end)
+
+    def __utc_offset(self):
+        """
+        Returns the function giving the UTC offset at a timestamp of the time slot, to compare the slots with the events.
+        Timestamps of the time slot are read on the wall clock so that days and business hours fall in place.
+
+        :return: function returning the offset in microseconds, or None if the time slot is naive
+        """
+        offset = self.__start_time.utcoffset()
+        if offset is None:
+            return None
+        if isinstance(self.__start_time.tzinfo, timezone):
+            offset = offset // _MICROSECOND
+            return lambda timestamp: offset
+        return lambda timestamp: self.__datetime(timestamp).utcoffset() // _MICROSECOND
+
     def __extends(self) -> datetime:
         """
         Extends the time slot by the given duration.
@@ -273,75 +578,115 @@ class TimeSlot:
         """
         return self.__start_time + self.slot_duration
 
-    def __rrulestr(self, start_time: datetime = None) -> rrulestr:
+    def __rrulestr(self, start_time: datetime = None) -> rrule:
         """"
-        Returns the rrulestr for the time slot.
+        Returns the rrule for the time slot, built directly rather than parsed from a string and caching its occurrences.
         
         :param start_time: start time of the time slot (default: None)
-        :return: the rrulestr
+        :return: the rrule
         """
         start_time = start_time if start_time else self.__start_time
-        interval = (self.__duration + self.__gap).seconds // 60
-        freq = "FREQ=MINUTELY;INTERVAL={}".format(interval)
-        return rrulestr(freq, dtstart=start_time)
+        return rrule(MINUTELY, interval=self.__step // timedelta(minutes=1), dtstart=start_time, cache=True)
+
+    def __interval(self) -> timedelta:
+        """
+        Returns the interval between the start of two consecutive slots, rounded down to whole minutes.
+
+        :return: the interval
+        """
+        return timedelta(minutes=(self.__duration + self.__gap) // timedelta(minutes=1))
     
     def __generate(self) -> 'TimeSlot':
         """
         Generates the time slot list with events.
+
+        Slots are ``start + k * step`` for every ``k`` up to the end time, so no recurrence rule has to be iterated.
+        Only the part of each day a slot can start at is walked, so nights and days off are never generated.
+        Nothing is computed here: slots are streamed from the grid when iterated, and stored as an array of start timestamps once counted or indexed.
         
         :return: the time slot
         """
-        self.__slots = self.rule.between(after=self.__start_time, before=self.__end_time, inc=True)
-
-        # iterate over each slot and remove the slots that are not in business hours
-        if self.__business_hours is not None:
-            self.__slots = list(filter(lambda x: self.__business_hours.is_in_business_hours(x, x + self.__duration), self.__slots))
-
-        self.__slots = list(filter(lambda x: x.date() == (x + self.__duration).date(), self.__slots))
+        # slots start on whole seconds, the first one not before the start time, as with the rrule used before
+        origin = self.__start_time.replace(microsecond=0)
+        self.__origin = origin + self.__step if origin < self.__start_time else origin
+        self.__base = _wall_timestamp(self.__origin)
+        end = _wall_timestamp(self.__start_time) + (self.__end_time - self.__start_time) // _MICROSECOND
+
+        table = self.__business_hours._table if self.__business_hours is not None else None
+        self.__grid = (self.__base, end, self.__step // _MICROSECOND, _slot_windows(self.__duration // _MICROSECOND, table))
+        self.__removals: list = []
+        self.__starts: array = None
+        self.__as_events = False
+        self.__event_list: list = None
         return self
-    
-    def __is_overlapping_events(self, slot: EventSlot, events: list) -> bool:
+
+    def format_all(self, prefix: str = "") -> str:
         """
-        Checks if the given slot is overlapping with any of the given events.
-        
-        :param slot: slot to check
-        :param events: list of events to check against
-        :return: True if the slot is overlapping with any of the events, False otherwise
+        Formats every slot on its own line, to be written at once.
+
+        :param prefix: text to put before each slot (default: "")
+        :return: the formatted slots
         """
-        for event in events:
-            if slot.is_overlapping(event):
-                return True
-        return False
-    
+        return "\n".join([prefix + str(slot) for slot in self])
+
     def to_json(self) -> list:
         """
         Converts the time slot to a JSON list.
         
         :return: JSON list
         """
-        return list(map(lambda slot: slot.to_json(), self.__slots))
+        if self.__event_list is not None:
+            return [slot.to_json() for slot in self.__event_list]
+
+        duration = self.__duration
+        return [{
+            "start_time": start.isoformat(),
+            "end_time": (start + duration).isoformat(),
+            "info": None
+        } for start in self.__datetimes()]
     
-    def to_ics(self) -> list:
+    def to_ics(self, busy: bool = False, dtstamp: datetime = None, uid_gen: Callable[[], str] = None) -> list:
         """
         Converts the time slot to an ICS list.
         
+        :param busy: whether the slots are busy or free (default: False)
+        :param dtstamp: creation time of the iCal events (default: None, i.e. now)
+        :param uid_gen: function returning the UID of each event (default: None, i.e. counters on one random UID)
         :return: ICS list"""
-        return list(map(lambda slot: slot.to_ics(), self.__slots))
+        dtstamp = dtstamp if dtstamp else datetime.utcnow()
+        uid_gen = uid_gen if uid_gen else _uid_generator()
+        return [slot.to_ics(busy=busy, dtstamp=dtstamp, uid_gen=uid_gen) for slot in self.__event_slots()]
     
 class Calendar:
     """
     Calendar class.
+
+    Adding or removing events does not regenerate the time slots, they are brought up to date by the next call to ``get_slots``.
+    Until ``generate_slots`` is called, ``get_slots`` returns the slots of the current day (UTC).
+    Events changed in place (e.g. extended) are taken into account by the next call to ``get_slots`` as well.
+    Time slots returned by ``get_slots`` are never changed by the calendar: once the slots change, a new time slot is returned.
     
     :param business_hours: business hours of the calendar (default: None)
     """
+    __slots__ = ('__business_hours', '__events', '__free_slots', '__time_slots', '__start_time', '__end_time', '__duration', '__gap', '__slots_key', '__dirty', '__added', '__keys')
+
     def __init__(self, business_hours: BusinessHours = None):
         self.__business_hours = business_hours
-        self.__events: list = []
-        self.__time_slots: list = []
+        # events ordered by interval
+        self.__events = SortedIntervals()
+        # up-to-date time slots, never handed out
+        self.__free_slots: TimeSlot = None
+        # copy of the time slots returned by get_slots
+        self.__time_slots: TimeSlot = None
         self.__start_time: datetime = None
         self.__end_time: datetime = None
         self.__duration: timedelta = None
         self.__gap: timedelta = None
+        self.__slots_key: tuple = None
+        self.__dirty: bool = True
+        self.__added: list = []
+        # intervals each event was added with, by event id
+        self.__keys: dict = {}
 
     def add_event(self, event: EventSlot = None, start_time = None, end_time = None, duration: timedelta = None) -> 'Calendar':
         """
@@ -353,12 +698,11 @@ class Calendar:
         :param duration: duration of the event (default: None)
         :return: the calendar
         """
-        if event is not None:
-            self.__events.append(event)
-        else:
-            self.__events.append(EventSlot(start_time=start_time, end_time=end_time, duration=duration))
+        if event is None:
+            event = EventSlot(start_time=start_time, end_time=end_time, duration=duration)
 
-        self._generate_slots()
+        self.__index(event)
+        self.__add_pending([event])
         return self
     
     def remove_event(self, event: EventSlot) -> 'Calendar':
@@ -368,8 +712,8 @@ class Calendar:
         :param event: event to remove
         :return: the calendar
         """
-        self.__events.remove(event)
-        self._generate_slots()
+        self.__unindex(event)
+        self.__dirty = True
         return self
     
     def import_events(self, events: list) -> 'Calendar':
@@ -379,8 +723,9 @@ class Calendar:
         :param events: events to import (list of events)
         :return: the calendar
         """
-        self.__events.extend(events)
-        self._generate_slots()
+        for event in events:
+            self.__index(event)
+        self.__add_pending(events)
         return self
     
     def purge_events(self, events: list):
@@ -391,8 +736,8 @@ class Calendar:
         :return: the calendar
         """
         for event in events:
-            self.__events.remove(event)
-        self._generate_slots()
+            self.__unindex(event)
+        self.__dirty = True
         return self
     
     def generate_slots(self, start_time: datetime = None, end_time: datetime = None, duration: timedelta = None, gap: timedelta = None) -> 'Calendar':
@@ -419,24 +764,107 @@ class Calendar:
         
         :return: the calendar
         """
-        self.__time_slots = TimeSlot(start_time=self.__start_time, end_time=self.__end_time, business_hours=self.__business_hours, duration=self.__duration, gap=self.__gap, booked_slots=self.__events)
+        # the slots only change with the window or the events
+        self.__reindex()
+        key = (self.__start_time, self.__end_time, self.__duration, self.__gap, self.__business_hours, tuple((event.start_time, event.end_time) for event in self.__events))
+        if key != self.__slots_key:
+            self.__free_slots = TimeSlot(start_time=self.__start_time, end_time=self.__end_time, business_hours=self.__business_hours, duration=self.__duration, gap=self.__gap).remove(self.__events)
+            self.__slots_key = key
+        # the slots returned before may have been changed by the caller
+        self.__time_slots = None
+        self.__dirty = False
+        self.__added = []
         return self
 
+    def __add_pending(self, events: list) -> None:
+        """
+        Keeps track of the events added since the time slots were generated.
+        While no event has been removed, the time slots are brought up to date by removing those events only.
+
+        :param events: events added to the calendar
+        """
+        if not self.__dirty:
+            self.__added.extend(events)
+
+    def __index(self, event: EventSlot) -> None:
+        """
+        Adds the given event to the calendar.
+
+        :param event: event to add
+        """
+        self.__events.add(event._s, event._e, event)
+        self.__keys.setdefault(id(event), []).append((event._s, event._e))
+
+    def __unindex(self, event: EventSlot) -> None:
+        """
+        Removes the given event from the calendar, from the interval it was added with.
+
+        :param event: event to remove
+        """
+        keys = self.__keys.get(id(event))
+        if not keys:
+            raise ValueError("Event not in calendar")
+        start, end = keys.pop()
+        if not keys:
+            del self.__keys[id(event)]
+        self.__events.remove(start, end, event)
+
+    def __reindex(self) -> None:
+        """
+        Moves the events changed in place since they were added to their current interval, and marks the time slots to regenerate if any.
+        """
+        stale = {id(event): event for start, end, event in self.__events.intervals() if (start, end) != (event._s, event._e)}
+        if stale:
+            self.__dirty = True
+        for event in stale.values():
+            keys = self.__keys.pop(id(event))
+            for start, end in keys:
+                self.__events.remove(start, end, event)
+            for _ in keys:
+                self.__index(event)
+
     def get_slots(self) -> TimeSlot:
         """
-        Returns the time slots of the calendar.
+        Returns the time slots of the calendar, regenerating them if the events changed.
+        The same time slot is returned as long as the slots do not change.
         
         :return: the time slots
         """
+        self.__reindex()
+        if self.__dirty:
+            self._generate_slots()
+        elif self.__added:
+            self.__free_slots.remove(self.__added)
+            self.__slots_key = None
+            self.__added = []
+            self.__time_slots = None
+
+        if self.__time_slots is None:
+            self.__time_slots = self.__free_slots.copy()
         return self.__time_slots
     
+    def iter_free_slots(self, start_time: datetime = None, end_time: datetime = None):
+        """
+        Iterator over the free slots of the calendar between the given times, computed as they are reached.
+        
+        :param start_time: start time of the slots (default: None, i.e. the start time of the calendar)
+        :param end_time: end time of the slots (default: None, i.e. the end time of the calendar)
+        :return: iterator over the free slots (event slots)
+        """
+        start_time = start_time if start_time else self.__start_time
+        end_time = end_time if end_time else self.__end_time
+        duration = self.__duration if self.__duration else timedelta(minutes=30)
+        self.__reindex()
+        slots = TimeSlot(start_time=start_time, end_time=end_time, business_hours=self.__business_hours, duration=duration, gap=self.__gap).remove(self.__events)
+        return (EventSlot(start_time=start, duration=duration) for start in slots.iter_slots())
+
     def get_events(self) -> list:
         """
-        Returns the events of the calendar.
+        Returns the events of the calendar, in chronological order.
         
         :return: the events (list of events)
         """
-        return self.__events
+        return list(self.__events)
     
     def to_json(self) -> dict:
         """
@@ -446,7 +874,7 @@ class Calendar:
         """
         return {
             "events": list(map(lambda x: x.to_json(), self.__events)),
-            "slots": self.__time_slots.to_json()
+            "slots": self.get_slots().to_json()
         }
     
     def from_ical(self, ical: str) -> 'Calendar':
@@ -474,11 +902,13 @@ class Calendar:
         calendar.add('prodid', '-//TimeSlot//TimeSlot//EN')
         calendar.add('version', '2.0')
         calendar.add('method', 'PUBLISH')
-        
+
+        # shared by every event of the export
+        dtstamp, uid_gen = datetime.utcnow(), _uid_generator()
         for event in self.__events:
-            calendar.add_component(event.to_ics(busy=True))
+            calendar.add_component(event.to_ics(busy=True, dtstamp=dtstamp, uid_gen=uid_gen))
         
-        for slot in self.__time_slots.to_ics():
-            calendar.add_component(slot.to_ics(busy=False))
+        for slot in self.get_slots().to_ics(busy=False, dtstamp=dtstamp, uid_gen=uid_gen):
+            calendar.add_component(slot)
 
         return calendar.to_ical()
\ No newline at end of file